@@ -2,6 +2,10 @@ from graphviz import Graph, Digraph
 import random
 import copy
 import time
+import array
+import mmap
+import os
+import tempfile
 from PIL import Image
 
 class GrapheReel:
@@ -447,6 +451,218 @@ class GrapheReel:
         print(f"Erreur lors de l'écriture du fichier : {str(e)}")
         return False
 
+    @staticmethod
+    def _lire_aretes_dimacs(chemin, infos):
+        """
+        Parcourt un fichier DIMACS ligne par ligne sans construire de graphe.
+
+        Args:
+            chemin (str): Chemin vers le fichier DIMACS
+            infos (dict): Reçoit 'nb_noeuds' et 'nb_aretes' lus sur la ligne 'p'
+
+        Yields:
+            tuple: (source, dest) sous forme d'entiers DIMACS (à partir de 1)
+        """
+        with open(chemin, 'r') as f:
+            for line in f:
+                elements = line.split()
+                if not elements or elements[0] == 'c':
+                    continue
+                if elements[0] == 'p':
+                    if len(elements) != 4 or elements[1] != 'edge':
+                        raise ValueError("Format de ligne 'p' invalide")
+                    infos['nb_noeuds'] = int(elements[2])
+                    infos['nb_aretes'] = int(elements[3])
+                elif elements[0] == 'e':
+                    if len(elements) != 3:
+                        raise ValueError(f"Format de ligne 'e' invalide: {line.strip()}")
+                    yield int(elements[1]), int(elements[2])
+                else:
+                    print(f"Attention: ligne ignorée: {line.strip()}")
+
+    @staticmethod
+    def couleur_flux(indice):
+        """
+        Convertit un indice de couleur de `coloration_flux` en couleur hexadécimale.
+        Les premières couleurs reprennent la palette de Welsh-Powell, les suivantes
+        sont déterministes pour rester toutes distinctes.
+        """
+        couleurs_base = ["#4287f5", "#42f54b", "#f54242", "#f5f242", "#9942f5", "#f542f2"]
+        if indice < len(couleurs_base):
+            return couleurs_base[indice]
+        return f"#{indice:06x}"
+
+    @staticmethod
+    def coloration_flux(source, nb_noeuds=0, taille_bloc=65536, dossier_temp=None,
+                        fichier_sortie=None, verifier=True):
+        """
+        Coloration gloutonne hors mémoire pour les graphes trop grands pour `lire_fichier`.
+
+        Les arêtes sont lues une seule fois depuis la source et déversées dans un
+        fichier temporaire binaire. La liste d'adjacence est ensuite construite sur
+        disque (fichier projeté en mémoire avec mmap), puis les nœuds sont colorés
+        par degré décroissant (ordre de Welsh-Powell) avec la plus petite couleur
+        libre. Seuls des tableaux compacts par nœud (degré, décalage, couleur)
+        restent en mémoire.
+
+        Args:
+            source (str | iterable): Chemin d'un fichier DIMACS, ou itérable de
+                                     paires (source, dest) numérotées à partir de 1
+            nb_noeuds (int): Nombre de nœuds si la source est un itérable
+                             (sinon déduit du plus grand identifiant rencontré)
+            taille_bloc (int): Nombre d'arêtes gardées en mémoire avant écriture sur disque
+            dossier_temp (str, optional): Dossier des fichiers temporaires
+            fichier_sortie (str, optional): Écrit la coloration au format de `ecrire_coloration`
+            verifier (bool): Fait une passe supplémentaire pour compter les conflits
+
+        Returns:
+            tuple: (couleurs, stats) où couleurs est un array('i') d'indices de couleur
+                   (le nœud DIMACS i a la couleur couleurs[i - 1])
+        """
+        start_time = time.time()
+        infos = {'nb_noeuds': nb_noeuds, 'nb_aretes': None}
+        if isinstance(source, str):
+            aretes = GrapheReel._lire_aretes_dimacs(source, infos)
+        else:
+            aretes = iter(source)
+
+        def octets(tableau):
+            return tableau.buffer_info()[1] * tableau.itemsize
+
+        with tempfile.TemporaryDirectory(dir=dossier_temp) as dossier:
+            chemin_brut = os.path.join(dossier, "aretes.bin")
+            chemin_adj = os.path.join(dossier, "adjacence.bin")
+
+            # Passe 1 : lecture de la source, calcul des degrés, déversement des arêtes
+            degres = array.array('I')
+            tampon = array.array('I')
+            nb_aretes = 0
+            boucles = 0
+            memoire_pic = 0
+            with open(chemin_brut, 'wb') as f:
+                for s, d in aretes:
+                    s, d = int(s) - 1, int(d) - 1
+                    if s < 0 or d < 0:
+                        raise ValueError(f"Identifiant de nœud invalide: {s + 1} {d + 1}")
+                    if s == d:
+                        boucles += 1
+                        continue
+                    plus_grand = max(s, d)
+                    if plus_grand >= len(degres):
+                        degres.extend(array.array('I', bytes(4 * (plus_grand + 1 - len(degres)))))
+                    degres[s] += 1
+                    degres[d] += 1
+                    tampon.append(s)
+                    tampon.append(d)
+                    nb_aretes += 1
+                    if len(tampon) >= 2 * taille_bloc:
+                        memoire_pic = max(memoire_pic, octets(degres) + octets(tampon))
+                        tampon.tofile(f)
+                        del tampon[:]
+                memoire_pic = max(memoire_pic, octets(degres) + octets(tampon))
+                tampon.tofile(f)
+                del tampon[:]
+
+            n = max(infos['nb_noeuds'], len(degres))
+            if n > len(degres):
+                degres.extend(array.array('I', bytes(4 * (n - len(degres)))))
+
+            # Décalages de la liste d'adjacence (format CSR) et ordre par degré décroissant
+            decalages = array.array('Q', bytes(8 * (n + 1)))
+            for v in range(n):
+                decalages[v + 1] = decalages[v] + degres[v]
+            degre_max = max(degres) if n else 0
+            debut_degre = array.array('I', bytes(4 * (degre_max + 2)))
+            for v in range(n):
+                debut_degre[degre_max - degres[v] + 1] += 1
+            for k in range(1, degre_max + 2):
+                debut_degre[k] += debut_degre[k - 1]
+            ordre = array.array('I', bytes(4 * n))
+            for v in range(n):
+                rang = degre_max - degres[v]
+                ordre[debut_degre[rang]] = v
+                debut_degre[rang] += 1
+            memoire_pic = max(memoire_pic, octets(degres) + octets(decalages)
+                              + octets(debut_degre) + octets(ordre))
+            del debut_degre, degres
+
+            couleurs = array.array('i', [-1]) * n
+            conflits_final = 0
+            passes_disque = 0
+            if nb_aretes:
+                # Passe 2 : répartition des arêtes brutes dans la liste d'adjacence sur disque
+                with open(chemin_adj, 'wb') as f:
+                    f.truncate(8 * nb_aretes)
+                positions = array.array('Q', decalages[:n])
+                memoire_pic = max(memoire_pic, octets(decalages) + octets(ordre)
+                                  + octets(couleurs) + octets(positions))
+                with open(chemin_brut, 'rb') as fb, open(chemin_adj, 'r+b') as fa, \
+                        mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mb, \
+                        mmap.mmap(fa.fileno(), 0) as ma:
+                    with memoryview(mb).cast('I') as brut, memoryview(ma).cast('I') as adj:
+                        for i in range(0, 2 * nb_aretes, 2):
+                            s, d = brut[i], brut[i + 1]
+                            adj[positions[s]] = d
+                            positions[s] += 1
+                            adj[positions[d]] = s
+                            positions[d] += 1
+                passes_disque += 1
+                del positions
+                os.remove(chemin_brut)
+
+                # Passe 3 : coloration gloutonne, la plus petite couleur absente des voisins
+                marque = array.array('I', bytes(4 * (degre_max + 2)))
+                memoire_pic = max(memoire_pic, octets(decalages) + octets(ordre)
+                                  + octets(couleurs) + octets(marque))
+                with open(chemin_adj, 'rb') as fa, \
+                        mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as ma, \
+                        memoryview(ma).cast('I') as adj:
+                    for v in ordre:
+                        for voisin in adj[decalages[v]:decalages[v + 1]]:
+                            c = couleurs[voisin]
+                            if c >= 0:
+                                marque[c] = v + 1
+                        c = 0
+                        while marque[c] == v + 1:
+                            c += 1
+                        couleurs[v] = c
+                    passes_disque += 1
+
+                    # Passe 4 (optionnelle) : comptage des conflits
+                    if verifier:
+                        for v in range(n):
+                            for voisin in adj[decalages[v]:decalages[v + 1]]:
+                                if voisin > v and couleurs[voisin] == couleurs[v]:
+                                    conflits_final += 1
+                        passes_disque += 1
+            else:
+                for v in range(n):
+                    couleurs[v] = 0
+
+        if fichier_sortie:
+            with open(fichier_sortie, 'w') as f:
+                for v in range(n):
+                    f.write(f"{v + 1} {GrapheReel.couleur_flux(couleurs[v])}\n")
+
+        temps_execution = time.time() - start_time
+
+        if infos['nb_aretes'] is not None and infos['nb_aretes'] != nb_aretes:
+            print(f"Attention: nombre d'arêtes différent de celui déclaré ({infos['nb_aretes']})")
+
+        stats = {
+            'temps_execution': round(temps_execution, 10),
+            'passes_source': 1,
+            'passes_disque': passes_disque,
+            'memoire_pic': memoire_pic,
+            'nb_noeuds': n,
+            'nb_aretes': nb_aretes,
+            'boucles_ignorees': boucles,
+            'nb_couleurs': max(couleurs) + 1 if n else 0,
+            'conflits_final': conflits_final if verifier else None,
+            'methode': 'glouton_flux'
+        }
+        return couleurs, stats
+
 def creer_graphe_interactif():
     """Fonction pour créer un graphe de manière interactive"""
     print("Création d'un nouveau graphe")
@@ -498,6 +714,7 @@ def afficher_menu():
     print("12. Évaluer la coloration")
     print("13. Visualiser le graphe (PNG)")
     print("14. Colorer le graphe (Hill-Climbing)")
+    print("15. Colorer un fichier volumineux (glouton en flux)")
     print("0.  Quitter")
 
 def main():
@@ -645,6 +862,21 @@ def main():
             print(f"Conflits finaux: {stats['conflits_final']}")
           else:
            print("Aucun graphe n'est chargé.")
+
+        elif choix == "15":
+            fichier = input("Nom du fichier DIMACS à colorer : ")
+            sortie = input("Fichier de sortie de la coloration (Entrée pour ignorer) : ").strip()
+            try:
+                couleurs, stats = GrapheReel.coloration_flux(fichier, fichier_sortie=sortie or None)
+                print("\nStatistiques:")
+                print(f"Temps d'exécution: {stats['temps_execution']} secondes")
+                print(f"Nœuds: {stats['nb_noeuds']}, arêtes: {stats['nb_aretes']}")
+                print(f"Passes: {stats['passes_source']} sur le fichier, {stats['passes_disque']} sur disque")
+                print(f"Mémoire de travail maximale: {stats['memoire_pic']} octets")
+                print(f"Nombre de couleurs: {stats['nb_couleurs']}")
+                print(f"Conflits finaux: {stats['conflits_final']}")
+            except Exception as e:
+                print(f"Erreur : {str(e)}")
         
         input("\nAppuyez sur Entrée pour continuer...")
 